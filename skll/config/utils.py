@@ -7,14 +7,19 @@ Utility classes and functions to parse SKLL configuration files.
 :author: Michael Heilman (mheilman@ets.org)
 """
 
-import csv
 import errno
+import json
 import logging
-from os.path import exists, isabs, join, normpath
+import os
+from functools import lru_cache
+from os.path import abspath, exists, isabs, join, normpath
 
+import pandas as pd
 import ruamel.yaml as yaml
 from sklearn.metrics import SCORERS
 
+_LOGGER = logging.getLogger(__name__)
+
 
 def fix_json(json_string):
     """
@@ -40,7 +45,8 @@ def fix_json(json_string):
 def load_cv_folds(folds_file, ids_to_floats=False):
     """
     Loads cross-validation folds from a CSV file with two columns for example
-    ID and fold ID (and a header).
+    ID and fold ID (and a header). The parsed folds are cached and only
+    re-read if the file is modified.
 
     Parameters
     ----------
@@ -60,20 +66,69 @@ def load_cv_folds(folds_file, ids_to_floats=False):
     ValueError
         If example IDs cannot be converted to floats and `ids_to_floats` is `True`.
     """
-    with open(folds_file, 'r') as f:
-        reader = csv.reader(f)
-        next(reader)  # discard the header
-        res = {}
-        for row in reader:
-            if ids_to_floats:
+    folds_path = abspath(folds_file)
+    folds_stat = os.stat(folds_path)
+
+    # return a copy so that callers can safely modify the dictionary
+    res = dict(_load_cv_folds_cached(folds_path,
+                                     folds_stat.st_mtime_ns,
+                                     folds_stat.st_size,
+                                     ids_to_floats))
+    return res
+
+
+@lru_cache(maxsize=16)
+def _load_cv_folds_cached(folds_path, mtime, size, ids_to_floats):
+    """
+    Read the cross-validation folds from the given CSV file. The
+    modification time and size of the file are part of the cache
+    key so that modified files are always re-read.
+
+    Parameters
+    ----------
+    folds_path : str
+        The absolute path to a folds file to read.
+    mtime : int
+        The modification time of the file in nanoseconds.
+    size : int
+        The size of the file in bytes.
+    ids_to_floats : bool
+        Whether to convert IDs to floats.
+
+    Returns
+    -------
+    res : dict
+        A dictionary with example IDs as the keys and fold IDs as the values.
+
+    Raises
+    ------
+    ValueError
+        If example IDs cannot be converted to floats and `ids_to_floats` is `True`.
+    """
+    # read the first two columns as plain strings in one go, discarding
+    # the header and without treating any values as missing
+    df_folds = pd.read_csv(folds_path,
+                           header=0,
+                           usecols=[0, 1],
+                           dtype=str,
+                           na_filter=False)
+    ids = df_folds.iloc[:, 0]
+    if ids_to_floats:
+        try:
+            ids = ids.astype(float)
+        except ValueError:
+            # find the first offending ID so that we can report it;
+            # this only runs after the conversion has already failed
+            for example_id in ids:
                 try:
-                    row[0] = float(row[0])
+                    float(example_id)
                 except ValueError:
                     raise ValueError('You set ids_to_floats to true, but ID {}'
                                      ' could not be converted to float'
-                                     .format(row[0]))
-            res[row[0]] = row[1]
+                                     .format(example_id))
+            raise
 
+    res = dict(zip(ids.tolist(), df_folds.iloc[:, 1].tolist()))
     return res
 
 
@@ -127,10 +182,33 @@ def _munge_featureset_name(featureset):
     if isinstance(featureset, str):
         return featureset
 
-    res = '+'.join(sorted(featureset))
+    # no need to sort if there is only a single feature set
+    if len(featureset) <= 1:
+        return '+'.join(featureset)
+
+    res = _join_sorted_featureset_names(tuple(featureset))
     return res
 
 
+@lru_cache(maxsize=128)
+def _join_sorted_featureset_names(featureset):
+    """
+    Joins the sorted features in featureset by '+'. This is cached
+    because the same featureset is munged repeatedly.
+
+    Parameters
+    ----------
+    featureset : tuple of str
+        A tuple of feature set names.
+
+    Returns
+    -------
+    res : str
+        feature_set names sorted and joined with '+'.
+    """
+    return '+'.join(sorted(featureset))
+
+
 def _parse_and_validate_metrics(metrics, option_name, logger=None):
     """
     Given a string containing a list of metrics, this function
@@ -159,13 +237,19 @@ def _parse_and_validate_metrics(metrics, option_name, logger=None):
         If there are any invalid metrics specified.
     """
 
-    # create a logger if one was not passed in
+    # use the module logger if one was not passed in
     if not logger:
-        logger = logging.getLogger(__name__)
+        logger = _LOGGER
 
     # make sure the given metrics data type is a list
-    # and parse it correctly
-    metrics = yaml.safe_load(fix_json(metrics))
+    # and parse it correctly; the fixed string is almost always
+    # valid JSON so try the much faster JSON parser first and
+    # only fall back to YAML for anything else
+    metrics_string = fix_json(metrics)
+    try:
+        metrics = json.loads(metrics_string)
+    except ValueError:
+        metrics = yaml.safe_load(metrics_string)
     if not isinstance(metrics, list):
         raise TypeError("{} should be a list, not a {}.".format(option_name,
                                                                 type(metrics)))
@@ -763,7 +763,8 @@ class Learner(object):
               grid_search=True,
               grid_objective=None,
               grid_jobs=None,
-              shuffle=False):
+              shuffle=False,
+              return_train_predictions=False):
         """
         Train a classification model and return the model, score, feature
         vectorizer, scaler, label dictionary, and inverse label dictionary.
@@ -798,16 +799,25 @@ class Learner(object):
         shuffle : bool, optional
             Shuffle examples (e.g., for grid search CV.)
             Defaults to ``False``.
+        return_train_predictions : bool, optional
+            Should we also return the predictions of the trained
+            model on ``examples``? This avoids having to call
+            ``predict()`` on the training set, which would transform
+            all of the training features again.
+            Defaults to ``False``.
 
         Returns
         -------
-        tuple : (float, dict)
+        tuple : (float, dict) or (float, dict, array-like)
             1) The best grid search objective function score, or 0 if
             we're not doing grid search, and 2) a dictionary of grid
             search CV results with keys such as "params",
             "mean_test_score", etc, that are mapped to lists of values
             associated with each hyperparameter set combination, or
-            None if not doing grid search.
+            None if not doing grid search. If ``return_train_predictions``
+            is ``True``, 3) the predictions on ``examples``, exactly as
+            they would be returned by ``predict()`` with the default
+            arguments.
 
         Raises
         ------
@@ -875,6 +885,7 @@ class Learner(object):
         # If grid search is True but shuffle isn't, shuffle anyway.
         # You can't shuffle a scipy sparse matrix in place, so unfortunately
         # we make a copy of everything (and then get rid of the old version)
+        unshuffled_examples = examples
         if grid_search or shuffle:
             if grid_search and not shuffle:
                 self.logger.warning('Training data will be shuffled to randomize '
@@ -1082,7 +1093,20 @@ class Learner(object):
 
             self.pipeline = Pipeline(steps=pipeline_steps)
 
-        return grid_score, grid_cv_results
+        if not return_train_predictions:
+            return grid_score, grid_cv_results
+
+        # compute the predictions on the training examples; we can reuse
+        # the already transformed training features unless they were
+        # shuffled in which case they are no longer in the original order
+        if examples is not unshuffled_examples:
+            train_predictions = self.predict(unshuffled_examples)
+        elif self.probability:
+            train_predictions = self._model.predict_proba(xtrain)
+        else:
+            train_predictions = self._model.predict(xtrain)
+
+        return grid_score, grid_cv_results, train_predictions
 
     def evaluate(self, examples, prediction_prefix=None, append=False,
                  grid_objective=None, output_metrics=[]):
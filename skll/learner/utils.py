@@ -28,6 +28,12 @@ from skll.utils.constants import (CLASSIFICATION_ONLY_METRICS,
                                   UNWEIGHTED_KAPPA_METRICS,
                                   WEIGHTED_KAPPA_METRICS)
 
+_LOGGER = logging.getLogger(__name__)
+
+# custom learners that have already been loaded, keyed by the
+# absolute path of the custom learner file and the learner name
+_CUSTOM_LEARNER_CACHE = {}
+
 
 class Densifier(BaseEstimator, TransformerMixin):
     """
@@ -45,7 +51,9 @@ class Densifier(BaseEstimator, TransformerMixin):
         return self
 
     def transform(self, X):
-        return X.todense()
+        # return a regular ``ndarray`` rather than a ``np.matrix``
+        # and leave already dense inputs alone
+        return X.toarray() if sp.issparse(X) else np.asarray(X)
 
 
 class FilteredLeaveOneGroupOut(LeaveOneGroupOut):
@@ -66,8 +74,13 @@ class FilteredLeaveOneGroupOut(LeaveOneGroupOut):
         super(FilteredLeaveOneGroupOut, self).__init__()
         self.keep = keep
         self.example_ids = example_ids
+        # precompute which examples we want to keep so that each split
+        # only needs a single vectorized lookup
+        self._keep_mask = np.array([example_id in keep
+                                    for example_id in example_ids],
+                                   dtype=bool)
         self._warned = False
-        self.logger = logger if logger else logging.getLogger(__name__)
+        self.logger = logger if logger else _LOGGER
 
     def split(self, X, y, groups):
         """
@@ -93,14 +106,12 @@ class FilteredLeaveOneGroupOut(LeaveOneGroupOut):
         """
         for train_index, test_index in super(FilteredLeaveOneGroupOut,
                                              self).split(X, y, groups):
-            train_len = len(train_index)
-            test_len = len(test_index)
-            train_index = [i for i in train_index if self.example_ids[i] in
-                           self.keep]
-            test_index = [i for i in test_index if self.example_ids[i] in
-                          self.keep]
-            if not self._warned and (train_len != len(train_index) or
-                                     test_len != len(test_index)):
+            train_len = train_index.size
+            test_len = test_index.size
+            train_index = train_index[self._keep_mask[train_index]]
+            test_index = test_index[self._keep_mask[test_index]]
+            if not self._warned and (train_len != train_index.size or
+                                     test_len != test_index.size):
                 self.logger.warning('Feature set contains IDs that are not ' +
                                     'in folds dictionary. Skipping those IDs.')
                 self._warned = True
@@ -140,20 +151,13 @@ class SelectByMinCount(SelectKBest):
         self
         """
 
-        # initialize a list of counts of times each feature appears
-        col_counts = [0 for _ in range(X.shape[1])]
-
+        # count the number of examples in which each feature appears,
+        # i.e., the number of non-zero entries in each column
         if sp.issparse(X):
-            # find() is scipy.sparse's equivalent of nonzero()
-            _, col_indices, _ = sp.find(X)
+            self.scores_ = np.asarray((X != 0).getnnz(axis=0)).ravel()
         else:
-            # assume it's a numpy array (not a numpy matrix)
-            col_indices = X.nonzero()[1].tolist()
+            self.scores_ = np.count_nonzero(np.asarray(X), axis=0)
 
-        for i in col_indices:
-            col_counts[i] += 1
-
-        self.scores_ = np.array(col_counts)
         return self
 
     def _get_support_mask(self):
@@ -166,9 +170,7 @@ class SelectByMinCount(SelectKBest):
         mask : np.array
             The mask with features to keep set to True.
         """
-        mask = np.zeros(self.scores_.shape, dtype=bool)
-        mask[self.scores_ >= self.min_count] = True
-        return mask
+        return self.scores_ >= self.min_count
 
 
 def contiguous_ints_or_floats(numbers):
@@ -198,27 +200,29 @@ def contiguous_ints_or_floats(numbers):
         If ``numbers`` is empty.
     """
 
-    try:
-
-        # make sure that number is not empty
-        assert len(numbers) > 0
+    numbers = np.asarray(numbers)
 
-        # first check that the numbers are all integers
-        # or integer-like floats (e.g., 1.0, 2.0 etc.)
-        ints_or_int_like_floats = np.all(np.mod(numbers, 1) == 0)
-
-        # next check that the successive differences between
-        # the numbers are all 1, i.e., they are nuermicontiguous
-        contiguous = np.all(np.diff(numbers) == 1)
-
-    except AssertionError:
+    # make sure that number is not empty
+    if numbers.size == 0:
         raise ValueError('Input cannot be empty.')
 
-    except TypeError:
+    # make sure that we only have integers or floats
+    if numbers.dtype.kind not in 'iuf':
         raise TypeError('Input should only contain numbers.')
 
-    # we need both conditions to be true
-    return ints_or_int_like_floats and contiguous
+    # first check that the numbers are all integers
+    # or integer-like floats (e.g., 1.0, 2.0 etc.);
+    # this is trivially true for integer arrays
+    if numbers.dtype.kind == 'f' and not np.all(np.mod(numbers, 1) == 0):
+        return False
+
+    # next check that the successive differences between
+    # the numbers are all 1, i.e., they are numerically
+    # contiguous; comparing the first and the last number
+    # rules out most non-contiguous inputs without a full scan
+    return bool(numbers.size == 1 or
+                (numbers[-1] - numbers[0] == numbers.size - 1 and
+                 np.all(np.diff(numbers) == 1)))
 
 
 def get_acceptable_regression_metrics():
@@ -329,10 +333,63 @@ def load_custom_learner(custom_learner_path, custom_learner_name):
         raise ValueError('custom_learner_path must end in .py ({})'
                          .format(custom_learner_path))
 
+    # return the custom learner right away if we have already loaded it
+    cache_key = (os.path.abspath(custom_learner_path), custom_learner_name)
+    if cache_key in _CUSTOM_LEARNER_CACHE:
+        return _CUSTOM_LEARNER_CACHE[cache_key]
+
     custom_learner_module_name = os.path.basename(custom_learner_path)[:-3]
-    sys.path.append(os.path.dirname(os.path.abspath(custom_learner_path)))
+    custom_learner_dir = os.path.dirname(cache_key[0])
+    if custom_learner_dir not in sys.path:
+        sys.path.append(custom_learner_dir)
     import_module(custom_learner_module_name)
-    return getattr(sys.modules[custom_learner_module_name], custom_learner_name)
+    custom_learner_obj = getattr(sys.modules[custom_learner_module_name],
+                                 custom_learner_name)
+    _CUSTOM_LEARNER_CACHE[cache_key] = custom_learner_obj
+    return custom_learner_obj
+
+
+def _get_init_param_names(init):
+    """
+    Get the names of the parameters for the given ``__init__()`` method,
+    excluding ``self`` and any variable keyword arguments. This is
+    adapted from scikit-learn's ``BaseEstimator._get_param_names()``.
+
+    Parameters
+    ----------
+    init : function
+        The ``__init__()`` method to inspect. Note that any function
+        wrapped by ``init`` is not inspected.
+
+    Returns
+    -------
+    args : list of str
+        A list of parameter names for the given init method.
+
+    Raises
+    ------
+    RunTimeError
+        If `varargs` exist in the scikit-learn estimator.
+    """
+    # there are no parameters to introspect for the default init
+    if init is object.__init__:
+        return []
+
+    try:
+        signature = inspect.signature(init, follow_wrapped=False)
+    except (TypeError, ValueError):
+        return []
+
+    args = []
+    for parameter in signature.parameters.values():
+        if parameter.kind == parameter.VAR_POSITIONAL:
+            raise RuntimeError('scikit-learn estimators should always '
+                               'specify their parameters in the signature'
+                               ' of their init (no varargs).')
+        if parameter.name != 'self' and parameter.kind != parameter.VAR_KEYWORD:
+            args.append(parameter.name)
+
+    return args
 
 
 def rescaled(cls):
@@ -356,6 +413,8 @@ def rescaled(cls):
     ------
     ValueError
         If classifier cannot be rescaled (i.e. is not a regressor).
+    RunTimeError
+        If `varargs` exist in the scikit-learn estimator.
     """
     # If this class has already been run through the decorator, return it
     if hasattr(cls, 'rescale'):
@@ -391,18 +450,21 @@ def rescaled(cls):
         # fit a regular regression model
         orig_fit(self, X, y=y)
 
+        # convert once so that we can use the array methods below
+        y = np.asarray(y)
+
         if self.constrain:
             # also record the training data min and max
-            self.y_min = min(y)
-            self.y_max = max(y)
+            self.y_min = y.min()
+            self.y_max = y.max()
 
         if self.rescale:
             # also record the means and SDs for the training set
-            y_hat = orig_predict(self, X)
-            self.yhat_mean = np.mean(y_hat)
-            self.yhat_sd = np.std(y_hat)
-            self.y_mean = np.mean(y)
-            self.y_sd = np.std(y)
+            y_hat = np.asarray(orig_predict(self, X))
+            self.yhat_mean = y_hat.mean()
+            self.yhat_sd = y_hat.std()
+            self.y_mean = y.mean()
+            self.y_sd = y.std()
 
         return self
 
@@ -432,8 +494,7 @@ def rescaled(cls):
 
         if self.constrain:
             # apply min and max constraints
-            res = np.array([max(self.y_min, min(self.y_max, pred))
-                            for pred in res])
+            res = np.clip(res, self.y_min, self.y_max)
 
         return res
 
@@ -443,7 +504,8 @@ def rescaled(cls):
         """
         This is adapted from scikit-learns's ``BaseEstimator`` class.
         It gets the kwargs for the superclass's init method and adds the
-        kwargs for newly added ``__init__()`` method.
+        kwargs for newly added ``__init__()`` method. Since these do not
+        change, they are computed only once when the class is decorated.
 
         Parameters
         ----------
@@ -454,33 +516,8 @@ def rescaled(cls):
         -------
         args : list
             A list of parameter names for the class's init method.
-
-        Raises
-        ------
-        RunTimeError
-            If `varargs` exist in the scikit-learn estimator.
         """
-        try:
-            init = getattr(orig_init, 'deprecated_original', orig_init)
-
-            args, varargs, _, _ = inspect.getargspec(init)
-            if varargs is not None:
-                raise RuntimeError('scikit-learn estimators should always '
-                                   'specify their parameters in the signature'
-                                   ' of their init (no varargs).')
-            # Remove 'self'
-            args.pop(0)
-        except TypeError:
-            args = []
-
-        rescale_args = inspect.getargspec(class_x.__init__)[0]
-        # Remove 'self'
-        rescale_args.pop(0)
-
-        args += rescale_args
-        args.sort()
-
-        return args
+        return list(param_names)
 
     @wraps(cls.__init__)
     def init(self, constrain=True, rescale=True, **kwargs):
@@ -510,6 +547,13 @@ def rescaled(cls):
         self.y_sd = None
         orig_init(self, **kwargs)
 
+    # compute the sorted parameter names for the original
+    # and the new ``__init__()`` methods
+    param_names = sorted(_get_init_param_names(getattr(orig_init,
+                                                       'deprecated_original',
+                                                       orig_init)) +
+                         _get_init_param_names(init))
+
     # Override original functions with new ones
     cls.__init__ = init
     cls.fit = fit
@@ -521,6 +565,39 @@ def rescaled(cls):
     return cls
 
 
+def _find_label_positions(sorted_labels, labels):
+    """
+    Find the positions of the given labels in the given sorted array
+    of labels.
+
+    Parameters
+    ----------
+    sorted_labels : numpy.ndarray
+        A sorted array of unique labels.
+    labels : numpy.ndarray
+        The labels to look up.
+
+    Returns
+    -------
+    positions : numpy.ndarray
+        The position of each label in ``sorted_labels``.
+
+    Raises
+    ------
+    ValueError
+        If any of the labels is not in ``sorted_labels``.
+    """
+    # `np.searchsorted()` returns the insertion point for missing
+    # labels so we need to check that we actually found them
+    positions = np.searchsorted(sorted_labels, labels)
+    found = positions < len(sorted_labels)
+    found[found] = sorted_labels[positions[found]] == labels[found]
+    if not np.all(found):
+        raise ValueError('Label {} is not in the list of known labels {}.'
+                         .format(labels[~found][0], sorted_labels.tolist()))
+    return positions
+
+
 def train_and_score(learner,
                     train_examples,
                     test_examples,
@@ -557,22 +634,27 @@ def train_and_score(learner,
         ``learner`` on ``test_examples``.
     """
 
-    _ = learner.train(train_examples, grid_search=False, shuffle=False)
-    train_predictions = learner.predict(train_examples)
+    (_, _,
+     train_predictions) = learner.train(train_examples,
+                                        grid_search=False,
+                                        shuffle=False,
+                                        return_train_predictions=True)
     test_predictions = learner.predict(test_examples)
     if learner.model_type._estimator_type == 'classifier':
         test_label_list = np.unique(test_examples.labels).tolist()
         unseen_test_label_list = [label for label in test_label_list
                                   if label not in learner.label_list]
-        unseen_label_dict = {label: i for i, label in enumerate(unseen_test_label_list,
-                                                                start=len(learner.label_list))}
-        # combine the two dictionaries
-        train_and_test_label_dict = learner.label_dict.copy()
-        train_and_test_label_dict.update(unseen_label_dict)
-        train_labels = np.array([train_and_test_label_dict[label]
-                                 for label in train_examples.labels])
-        test_labels = np.array([train_and_test_label_dict[label]
-                                for label in test_examples.labels])
+        # the index of each label is its position in the combined list
+        # of the training labels and the unseen test labels; we map the
+        # labels to these indices by searching in the sorted list of
+        # labels and then looking up the original positions
+        train_and_test_labels = np.array(learner.label_list + unseen_test_label_list)
+        sorter = np.argsort(train_and_test_labels, kind='mergesort')
+        sorted_labels = train_and_test_labels[sorter]
+        train_labels = sorter[_find_label_positions(sorted_labels,
+                                                    train_examples.labels)]
+        test_labels = sorter[_find_label_positions(sorted_labels,
+                                                   test_examples.labels)]
     else:
         train_labels = train_examples.labels
         test_labels = test_examples.labels
@@ -8,6 +8,7 @@ Tests related to classification experiments.
 :author: Aoife Cahill (acahill@ets.org)
 """
 
+import copy
 import csv
 import itertools
 import json
@@ -1021,6 +1022,114 @@ def test_train_and_score_function():
     yield check_train_and_score_function, 'regressor'
 
 
+def check_train_and_score_function_label_mapping(num_labels,
+                                                 pos_label_str,
+                                                 missing_train_label=False):
+    """
+    Check that _train_and_score() maps unsorted and unseen labels correctly
+    """
+
+    # create train and test data with string labels
+    string_label_list = ['cat', 'ant', 'bee'][:num_labels]
+    (train_fs,
+     test_fs) = make_classification_data(num_examples=500,
+                                         train_test_ratio=0.7,
+                                         num_features=5,
+                                         num_labels=num_labels,
+                                         string_label_list=string_label_list,
+                                         use_feature_hashing=False,
+                                         non_negative=True)
+
+    # for the multi-class case, remove a label from the training set
+    # that sorts in between the two remaining labels so that it is
+    # only seen in the test set
+    if num_labels == 3:
+        full_train_fs = copy.deepcopy(train_fs)
+        train_fs.filter(labels=['bee'], inverse=True)
+        ok_('bee' not in train_fs.labels)
+        ok_('bee' in test_fs.labels)
+
+    # if the learner was already trained on data without one of the
+    # labels, its label dictionary is not re-created and so that label
+    # is unknown when it shows up in the training set; since `train()`
+    # itself would already fail on such a label, we replace it to make
+    # sure that _train_and_score() does not silently map it to the
+    # index of another label
+    if missing_train_label:
+        learner = Learner('LogisticRegression')
+        learner.train(train_fs, grid_search=False, shuffle=False)
+        learner.train = lambda examples, **kwargs: (None, None,
+                                                    learner.predict(examples))
+        test_fs.filter(labels=['bee'], inverse=True)
+        assert_raises(ValueError, train_and_score, learner, full_train_fs,
+                      test_fs, 'accuracy')
+        return
+
+    # call _train_and_score() on this data
+    learner1 = Learner('LogisticRegression', pos_label_str=pos_label_str)
+    train_score1, test_score1 = train_and_score(learner1, train_fs, test_fs,
+                                                'accuracy')
+
+    # with `pos_label_str`, the label list should not be sorted
+    if pos_label_str:
+        eq_(learner1.label_list, ['cat', 'ant'])
+
+    # compute the expected scores by mapping the labels to indices
+    # using the label dictionary of another instance of the same
+    # learner extended with any labels unseen during training
+    learner2 = Learner('LogisticRegression', pos_label_str=pos_label_str)
+    learner2.train(train_fs, grid_search=False, shuffle=False)
+    train_predictions = learner2.predict(train_fs)
+    test_predictions = learner2.predict(test_fs)
+    train_and_test_label_dict = learner2.label_dict.copy()
+    unseen_test_label_list = [label for label in np.unique(test_fs.labels)
+                              if label not in learner2.label_list]
+    train_and_test_label_dict.update({label: i for i, label in
+                                      enumerate(unseen_test_label_list,
+                                                start=len(learner2.label_list))})
+    train_labels = np.array([train_and_test_label_dict[label]
+                             for label in train_fs.labels])
+    test_labels = np.array([train_and_test_label_dict[label]
+                            for label in test_fs.labels])
+    train_score2 = use_score_func('accuracy', train_labels, train_predictions)
+    test_score2 = use_score_func('accuracy', test_labels, test_predictions)
+
+    eq_(train_score1, train_score2)
+    eq_(test_score1, test_score2)
+
+
+def test_train_and_score_function_label_mapping():
+    yield check_train_and_score_function_label_mapping, 3, None
+    yield check_train_and_score_function_label_mapping, 2, 'ant'
+    yield check_train_and_score_function_label_mapping, 3, None, True
+
+
+def check_train_with_train_predictions(probability, shuffle):
+    """
+    Check that the training predictions returned by `train()`
+    are the same as the ones from calling `predict()`
+    """
+
+    train_fs, _ = make_classification_data(num_examples=500,
+                                           train_test_ratio=0.7,
+                                           num_features=5,
+                                           use_feature_hashing=False,
+                                           non_negative=True)
+
+    learner = Learner('LogisticRegression', probability=probability)
+    (_, _,
+     train_predictions) = learner.train(train_fs,
+                                        grid_search=False,
+                                        shuffle=shuffle,
+                                        return_train_predictions=True)
+    assert_array_equal(train_predictions, learner.predict(train_fs))
+
+
+def test_train_with_train_predictions():
+    for probability, shuffle in product([False, True], [False, True]):
+        yield check_train_with_train_predictions, probability, shuffle
+
+
 @raises(ValueError)
 def check_learner_api_grid_search_no_objective(task='train'):
 
@@ -11,15 +11,17 @@ the future.
 
 import csv
 import os
+import sys
 from glob import glob
 from os.path import abspath, dirname, exists, join
 
 import numpy as np
-from nose.tools import raises
+from nose.tools import eq_, ok_, raises
 from numpy.testing import assert_array_equal
 from skll.data import NDJWriter
 from skll.experiments import run_configuration
 from skll.learner import Learner
+from skll.learner.utils import _CUSTOM_LEARNER_CACHE, load_custom_learner
 from skll.utils.constants import KNOWN_DEFAULT_PARAM_GRIDS
 
 from tests.utils import fill_in_config_paths, make_classification_data
@@ -230,3 +232,31 @@ def test_custom_learner_api_missing_file():
 def test_custom_learner_api_bad_extension():
     other_dir = join(_my_dir, 'other')
     _ = Learner('_CustomLogisticRegressionWrapper', custom_learner_path=join(other_dir, 'custom_learner.txt'))
+
+
+def test_load_custom_learner_cache():
+    """
+    Check that loading the same custom learner twice uses the cache
+    """
+    custom_learner_dir = join(_my_dir, 'other')
+    custom_learner_path = join(custom_learner_dir, 'custom_logistic_wrapper.py')
+
+    # loading the same learner twice should return the same object
+    learner_obj1 = load_custom_learner(custom_learner_path,
+                                       'CustomLogisticRegressionWrapper')
+    learner_obj2 = load_custom_learner(custom_learner_path,
+                                       'CustomLogisticRegressionWrapper')
+    ok_(learner_obj1 is learner_obj2)
+    ok_((abspath(custom_learner_path), 'CustomLogisticRegressionWrapper')
+        in _CUSTOM_LEARNER_CACHE)
+
+    # the directory of the learner should only be added to the path once
+    eq_(sys.path.count(custom_learner_dir), 1)
+
+    # a different learner from the same file gets its own cache entry
+    other_learner_obj = load_custom_learner(custom_learner_path,
+                                            'LogisticRegression')
+    ok_(other_learner_obj is not learner_obj1)
+    ok_((abspath(custom_learner_path), 'LogisticRegression')
+        in _CUSTOM_LEARNER_CACHE)
+    eq_(sys.path.count(custom_learner_dir), 1)
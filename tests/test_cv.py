@@ -226,6 +226,32 @@ def test_load_cv_folds_non_float_ids():
     load_cv_folds(fold_file_path, ids_to_floats=True)
 
 
+def test_load_cv_folds_modified_file():
+    """
+    Test to check that cached CV folds are re-read when the CSV file changes
+    """
+
+    # write a small CV folds file and load it
+    fold_file_path = join(_my_dir, 'other', 'custom_folds.csv')
+    with open(fold_file_path, 'w', newline='') as foldf:
+        w = csv.writer(foldf)
+        w.writerow(['id', 'fold'])
+        w.writerows([['a', '1'], ['b', '2']])
+    custom_cv_folds_loaded = load_cv_folds(fold_file_path)
+    eq_(custom_cv_folds_loaded, {'a': '1', 'b': '2'})
+
+    # modifying the returned dictionary should not affect the cache
+    custom_cv_folds_loaded['c'] = '3'
+    eq_(load_cv_folds(fold_file_path), {'a': '1', 'b': '2'})
+
+    # now change the file and make sure the new folds are loaded
+    with open(fold_file_path, 'w', newline='') as foldf:
+        w = csv.writer(foldf)
+        w.writerow(['id', 'fold'])
+        w.writerows([['a', '2'], ['b', '1'], ['c', '1']])
+    eq_(load_cv_folds(fold_file_path), {'a': '2', 'b': '1', 'c': '1'})
+
+
 def test_retrieve_cv_folds():
     """
     Test to make sure that the fold ids get returned correctly after cross-validation
@@ -113,6 +113,29 @@ def test_SelectByMinCount():
         expected)
 
 
+def test_SelectByMinCount_scores():
+    """ Test SelectByMinCount feature counts for different matrix formats """
+    m2 = [[0.001, 0.0, 0.0, 0.0],
+          [0.00001, -2.0, 0.0, 0.0],
+          [0.001, 0.0, 0.0, 4.0],
+          [0.0101, -200.0, 0.0, 0.0]]
+    expected = np.array([4, 2, 0, 1])
+
+    # explicitly stored zeros in sparse matrices should not be counted
+    m2_explicit_zeros = sp.csr_matrix(m2)
+    m2_explicit_zeros[0, 2] = 1.0
+    m2_explicit_zeros.data[m2_explicit_zeros.data == 1.0] = 0.0
+
+    for X in [np.array(m2),
+              sp.csr_matrix(m2),
+              sp.csc_matrix(m2),
+              sp.coo_matrix(m2),
+              m2_explicit_zeros]:
+        feat_selector = SelectByMinCount().fit(X)
+        assert_array_equal(feat_selector.scores_, expected)
+        assert_array_equal(feat_selector.get_support(), expected >= 1)
+
+
 def make_class_map_data():
     # Create training file
     train_path = join(_my_dir, 'train', 'test_class_map.jsonlines')